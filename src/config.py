@@ -58,6 +58,14 @@ class Settings(BaseSettings):
     default_page_size: int = Field(default=20, description="Default pagination size")
     max_page_size: int = Field(default=100, description="Maximum pagination size")
 
+    # Product read cache (per Lambda container, opt-in)
+    product_cache_enabled: bool = Field(
+        default=False, description="Cache get-by-id product reads per container"
+    )
+    product_cache_ttl_seconds: float = Field(
+        default=5.0, description="Product read cache TTL in seconds"
+    )
+
 
 @lru_cache()
 def get_settings() -> Settings:
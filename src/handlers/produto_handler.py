@@ -1,42 +1,133 @@
 # src/handlers/produto_handler.py
 """Produto (Product) Lambda handlers."""
 
-import asyncio
 import os
-from datetime import datetime
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from uuid import UUID
 
+import orjson
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.utils.lambda_decorators import (
     lambda_handler,
-    with_database,
-    require_auth,
-    validate_request_body,
+    build_handler,
     success_response,
     created_response,
+    error_response,
+    ndjson_response,
+    wants_ndjson,
     LambdaException,
 )
 from src.produto.application.services.produto_application_service import ProdutoApplicationService
+from src.config import get_settings
 from src.produto.application.dto.produto_dto import (
     ProdutoCreateDTO,
     ProdutoUpdateDTO,
     ProdutoSearchDTO,
+    ProdutoResponseDTO,
+    ProdutoListResponseDTO,
 )
-from src.shared.domain.exceptions.base import ValidationException, BusinessRuleException
-from src.config import get_settings
 
 
-logger = structlog.get_logger()
+SERVICE_NAME = "produto-service"
+SERVICE_VERSION = "1.0.0"
+
+logger = structlog.get_logger().bind(service=SERVICE_NAME, version=SERVICE_VERSION)
+
+_NDJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "service": SERVICE_NAME,
+    "version": SERVICE_VERSION,
+    "environment": os.getenv("ENVIRONMENT", "unknown"),
+}
+
+
+# Opt-in per-container read cache for get_product_handler. Each handler is its
+# own Lambda function, so writes elsewhere cannot invalidate it: entries are
+# only bounded by the TTL.
+_PRODUCT_CACHE_ENABLED = get_settings().product_cache_enabled
+_PRODUCT_CACHE_TTL = get_settings().product_cache_ttl_seconds
+_PRODUCT_CACHE_MAXSIZE = 512
+_PRODUCT_CACHE: OrderedDict[UUID, tuple[float, dict]] = OrderedDict()
+
+
+def _cache_get(product_id: UUID) -> dict | None:
+    """Get a cached product payload if it is still fresh."""
+    entry = _PRODUCT_CACHE.get(product_id)
+    if entry is None:
+        return None
+
+    stored_at, data = entry
+    if time.monotonic() - stored_at > _PRODUCT_CACHE_TTL:
+        del _PRODUCT_CACHE[product_id]
+        return None
+    return data
+
+
+def _cache_put(product_id: UUID, data: dict) -> None:
+    """Cache a product payload, evicting the oldest entry when full."""
+    _PRODUCT_CACHE[product_id] = (time.monotonic(), data)
+    _PRODUCT_CACHE.move_to_end(product_id)
+    if len(_PRODUCT_CACHE) > _PRODUCT_CACHE_MAXSIZE:
+        _PRODUCT_CACHE.popitem(last=False)
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID path parameter, memoized for frequently requested ids."""
+    return UUID(value)
+
+
+def _require_uuid(path_params: dict, key: str) -> UUID:
+    """Get a required UUID path parameter or raise a 400."""
+    value = path_params.get(key)
+    if not value:
+        raise LambdaException(400, f"{key} is required")
+
+    try:
+        return _parse_uuid(value)
+    except ValueError:
+        raise LambdaException(400, f"Invalid {key} format")
+
+
+@lru_cache(maxsize=256)
+def _validate_pagination(skip_raw: str | int, limit_raw: str | int) -> tuple[int, int]:
+    """Validate raw skip/limit values, memoized for repeated query strings."""
+    try:
+        skip = int(skip_raw)
+        limit = int(limit_raw)
+    except ValueError:
+        raise LambdaException(400, "skip and limit must be integers")
+
+    if skip < 0:
+        raise LambdaException(400, "skip must be >= 0")
+    if limit < 1 or limit > 1000:
+        raise LambdaException(400, "limit must be between 1 and 1000")
+
+    return skip, limit
+
+
+def _parse_pagination(query_params: dict) -> tuple[int, int]:
+    """Get validated (skip, limit) from query parameters or raise a 400."""
+    return _validate_pagination(query_params.get("skip", 0), query_params.get("limit", 100))
+
+
+def _fast_dump(dto: ProdutoResponseDTO | ProdutoListResponseDTO) -> dict:
+    """Convert a response DTO into a JSON-ready dict."""
+    data = dto._asdict()
+    if type(dto) is ProdutoListResponseDTO:
+        data["produtos"] = [produto._asdict() for produto in dto.produtos]
+    return data
 
 
 # === PRODUCT CRUD HANDLERS ===
 
-@lambda_handler
-@with_database
-@require_auth()
-@validate_request_body(ProdutoCreateDTO)
+@build_handler(dto_class=ProdutoCreateDTO, service_logger=logger)
 async def create_product_handler(
     event,
     context,
@@ -48,23 +139,12 @@ async def create_product_handler(
     dto: ProdutoCreateDTO,
 ):
     """Handler for creating new product."""
-    try:
-        service = ProdutoApplicationService(db)
-        product_response = await service.create_product(dto)
-        return created_response(product_response.dict())
+    service = ProdutoApplicationService(db)
+    product_response = await service.create_product(dto)
+    return created_response(_fast_dump(product_response))
 
-    except ValidationException as e:
-        raise LambdaException(400, e.message)
-    except BusinessRuleException as e:
-        raise LambdaException(409, e.message)
-    except Exception as e:
-        logger.error("Create product error", error=str(e))
-        raise LambdaException(500, "Internal server error")
 
-
-@lambda_handler
-@with_database
-@require_auth()
+@build_handler(service_logger=logger)
 async def get_product_handler(
     event,
     context,
@@ -76,31 +156,25 @@ async def get_product_handler(
 ):
     """Handler for getting product by ID."""
     product_id = path_params.get("product_id")
-    if not product_id:
-        raise LambdaException(400, "product_id is required")
+    product_uuid = _require_uuid(path_params, "product_id")
 
-    try:
-        product_uuid = UUID(product_id)
-    except ValueError:
-        raise LambdaException(400, "Invalid product_id format")
+    if _PRODUCT_CACHE_ENABLED:
+        cached = _cache_get(product_uuid)
+        if cached is not None:
+            return success_response(cached)
 
-    try:
-        service = ProdutoApplicationService(db)
-        product = await service.get_product_by_id(product_uuid)
-        if not product:
-            raise LambdaException(404, f"Product not found: {product_id}")
-        return success_response(product.dict())
+    service = ProdutoApplicationService(db)
+    product = await service.get_product_by_id(product_uuid)
+    if not product:
+        return error_response(f"Product not found: {product_id}", 404)
 
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("Get product error", product_id=product_id, error=str(e))
-        raise LambdaException(500, "Internal server error")
+    data = _fast_dump(product)
+    if _PRODUCT_CACHE_ENABLED:
+        _cache_put(product_uuid, data)
+    return success_response(data)
 
 
-@lambda_handler
-@with_database
-@require_auth()
+@build_handler(service_logger=logger)
 async def get_product_by_sku_handler(
     event,
     context,
@@ -115,23 +189,14 @@ async def get_product_by_sku_handler(
     if not sku:
         raise LambdaException(400, "sku is required")
 
-    try:
-        service = ProdutoApplicationService(db)
-        product = await service.get_product_by_sku(sku)
-        if not product:
-            raise LambdaException(404, f"Product not found with SKU: {sku}")
-        return success_response(product.dict())
-
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("Get product by SKU error", sku=sku, error=str(e))
-        raise LambdaException(500, "Internal server error")
+    service = ProdutoApplicationService(db)
+    product = await service.get_product_by_sku(sku)
+    if not product:
+        return error_response(f"Product not found with SKU: {sku}", 404)
+    return success_response(_fast_dump(product))
 
 
-@lambda_handler
-@with_database
-@require_auth()
+@build_handler(service_logger=logger)
 async def list_products_handler(
     event,
     context,
@@ -142,33 +207,22 @@ async def list_products_handler(
     user_info: dict,
 ):
     """Handler for listing products with pagination."""
-    try:
-        skip = int(query_params.get("skip", 0))
-        limit = int(query_params.get("limit", 100))
-    except ValueError:
-        raise LambdaException(400, "skip and limit must be integers")
+    skip, limit = _parse_pagination(query_params)
 
-    if skip < 0:
-        raise LambdaException(400, "skip must be >= 0")
-    if limit < 1 or limit > 1000:
-        raise LambdaException(400, "limit must be between 1 and 1000")
+    service = ProdutoApplicationService(db)
 
-    try:
-        service = ProdutoApplicationService(db)
-        products_list = await service.get_products(skip, limit)
-        return success_response(products_list.dict())
+    if wants_ndjson(event):
+        # Serialize row by row from the DB cursor, skipping the list DTO
+        buffer = bytearray()
+        async for product in service.stream_products(skip, limit):
+            buffer += orjson.dumps(_fast_dump(product), default=str, option=_NDJSON_OPTIONS)
+        return ndjson_response(bytes(buffer))
 
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("List products error", error=str(e))
-        raise LambdaException(500, "Internal server error")
+    products_list = await service.get_products(skip, limit)
+    return success_response(_fast_dump(products_list))
 
 
-@lambda_handler
-@with_database
-@require_auth()
-@validate_request_body(ProdutoUpdateDTO)
+@build_handler(dto_class=ProdutoUpdateDTO, service_logger=logger)
 async def update_product_handler(
     event,
     context,
@@ -181,35 +235,16 @@ async def update_product_handler(
 ):
     """Handler for updating product."""
     product_id = path_params.get("product_id")
-    if not product_id:
-        raise LambdaException(400, "product_id is required")
+    product_uuid = _require_uuid(path_params, "product_id")
 
-    try:
-        product_uuid = UUID(product_id)
-    except ValueError:
-        raise LambdaException(400, "Invalid product_id format")
-
-    try:
-        service = ProdutoApplicationService(db)
-        product = await service.update_product(product_uuid, dto)
-        if not product:
-            raise LambdaException(404, f"Product not found: {product_id}")
-        return success_response(product.dict())
-
-    except ValidationException as e:
-        raise LambdaException(400, e.message)
-    except BusinessRuleException as e:
-        raise LambdaException(409, e.message)
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("Update product error", product_id=product_id, error=str(e))
-        raise LambdaException(500, "Internal server error")
+    service = ProdutoApplicationService(db)
+    product = await service.update_product(product_uuid, dto)
+    if not product:
+        return error_response(f"Product not found: {product_id}", 404)
+    return success_response(_fast_dump(product))
 
 
-@lambda_handler
-@with_database
-@require_auth()
+@build_handler(service_logger=logger)
 async def delete_product_handler(
     event,
     context,
@@ -221,32 +256,16 @@ async def delete_product_handler(
 ):
     """Handler for deleting product."""
     product_id = path_params.get("product_id")
-    if not product_id:
-        raise LambdaException(400, "product_id is required")
+    product_uuid = _require_uuid(path_params, "product_id")
 
-    try:
-        product_uuid = UUID(product_id)
-    except ValueError:
-        raise LambdaException(400, "Invalid product_id format")
-
-    try:
-        service = ProdutoApplicationService(db)
-        success = await service.delete_product(product_uuid)
-        if not success:
-            raise LambdaException(404, f"Product not found: {product_id}")
-        return success_response({"message": "Product deleted successfully"})
+    service = ProdutoApplicationService(db)
+    success = await service.delete_product(product_uuid)
+    if not success:
+        return error_response(f"Product not found: {product_id}", 404)
+    return success_response({"message": "Product deleted successfully"})
 
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("Delete product error", product_id=product_id, error=str(e))
-        raise LambdaException(500, "Internal server error")
 
-
-@lambda_handler
-@with_database
-@require_auth()
-@validate_request_body(ProdutoSearchDTO)
+@build_handler(dto_class=ProdutoSearchDTO, service_logger=logger)
 async def search_products_handler(
     event,
     context,
@@ -258,34 +277,14 @@ async def search_products_handler(
     dto: ProdutoSearchDTO,
 ):
     """Handler for searching products."""
-    try:
-        skip = int(query_params.get("skip", 0))
-        limit = int(query_params.get("limit", 100))
-    except ValueError:
-        raise LambdaException(400, "skip and limit must be integers")
+    skip, limit = _parse_pagination(query_params)
 
-    if skip < 0:
-        raise LambdaException(400, "skip must be >= 0")
-    if limit < 1 or limit > 1000:
-        raise LambdaException(400, "limit must be between 1 and 1000")
-
-    try:
-        service = ProdutoApplicationService(db)
-        search_results = await service.search_products(dto, skip, limit)
-        return success_response(search_results.dict())
+    service = ProdutoApplicationService(db)
+    search_results = await service.search_products(dto, skip, limit)
+    return success_response(_fast_dump(search_results))
 
-    except ValidationException as e:
-        raise LambdaException(400, e.message)
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("Search products error", error=str(e))
-        raise LambdaException(500, "Internal server error")
 
-
-@lambda_handler
-@with_database
-@require_auth()
+@build_handler(service_logger=logger)
 async def get_products_by_category_handler(
     event,
     context,
@@ -300,27 +299,11 @@ async def get_products_by_category_handler(
     if not categoria:
         raise LambdaException(400, "categoria is required")
 
-    try:
-        skip = int(query_params.get("skip", 0))
-        limit = int(query_params.get("limit", 100))
-    except ValueError:
-        raise LambdaException(400, "skip and limit must be integers")
-
-    if skip < 0:
-        raise LambdaException(400, "skip must be >= 0")
-    if limit < 1 or limit > 1000:
-        raise LambdaException(400, "limit must be between 1 and 1000")
-
-    try:
-        service = ProdutoApplicationService(db)
-        products_list = await service.get_products_by_category(categoria, skip, limit)
-        return success_response(products_list.dict())
+    skip, limit = _parse_pagination(query_params)
 
-    except LambdaException:
-        raise
-    except Exception as e:
-        logger.error("Get products by category error", categoria=categoria, error=str(e))
-        raise LambdaException(500, "Internal server error")
+    service = ProdutoApplicationService(db)
+    products_list = await service.get_products_by_category(categoria, skip, limit)
+    return success_response(_fast_dump(products_list))
 
 
 # === UTILITY HANDLER ===
@@ -329,9 +312,6 @@ async def get_products_by_category_handler(
 async def health_check_handler(event, context, body, path_params, query_params):
     """Health check endpoint."""
     return success_response({
-        "status": "healthy",
-        "service": "produto-service",
-        "version": "1.0.0",
-        "environment": os.getenv("ENVIRONMENT", "unknown"),
-        "timestamp": datetime.utcnow().isoformat()
+        **_HEALTH_STATIC,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
     })
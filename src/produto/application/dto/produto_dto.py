@@ -2,49 +2,50 @@
 """Product DTOs."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, NamedTuple, Optional
 from uuid import UUID
 
-from pydantic import Field, validator
+import msgspec
+from msgspec import Meta
 
-from src.shared.application.dto.base import BaseDTO, CreateDTO, UpdateDTO, ResponseDTO
 
+VALID_UNITS = ('UN', 'KG', 'G', 'L', 'ML', 'M', 'CM', 'M2', 'M3', 'CX', 'PCT', 'FD')
 
-class ProdutoCreateDTO(CreateDTO):
+
+class ProdutoCreateDTO(msgspec.Struct, kw_only=True):
     """DTO for creating products."""
-    sku: str = Field(..., min_length=1, max_length=50, description="Product SKU")
-    nome: str = Field(..., min_length=1, max_length=255, description="Product name")
-    descricao: str = Field(default="", max_length=1000, description="Product description")
-    categoria: str = Field(..., min_length=1, max_length=100, description="Product category")
-    unidade_medida: str = Field(..., description="Unit of measure (UN, KG, L, etc.)")
-    nivel_minimo: int = Field(default=0, ge=0, description="Minimum stock level")
-    ativo: bool = Field(default=True, description="Product active status")
+    sku: Annotated[str, Meta(min_length=1, max_length=50, description="Product SKU")]
+    nome: Annotated[str, Meta(min_length=1, max_length=255, description="Product name")]
+    descricao: Annotated[str, Meta(max_length=1000, description="Product description")] = ""
+    categoria: Annotated[str, Meta(min_length=1, max_length=100, description="Product category")]
+    unidade_medida: Annotated[str, Meta(description="Unit of measure (UN, KG, L, etc.)")]
+    nivel_minimo: Annotated[int, Meta(ge=0, description="Minimum stock level")] = 0
+    ativo: Annotated[bool, Meta(description="Product active status")] = True
     
-    @validator('sku')
-    def validate_sku(cls, v):
-        if not v.replace('-', '').replace('_', '').isalnum():
+    def __post_init__(self):
+        if not self.sku.replace('-', '').replace('_', '').isalnum():
             raise ValueError('SKU must contain only letters, numbers, hyphens and underscores')
-        return v.upper()
-    
-    @validator('unidade_medida')
-    def validate_unit(cls, v):
-        valid_units = ['UN', 'KG', 'G', 'L', 'ML', 'M', 'CM', 'M2', 'M3', 'CX', 'PCT', 'FD']
-        if v.upper() not in valid_units:
-            raise ValueError(f'Invalid unit. Valid units: {", ".join(valid_units)}')
-        return v.upper()
+        self.sku = self.sku.upper()
+        
+        if self.unidade_medida.upper() not in VALID_UNITS:
+            raise ValueError(f'Invalid unit. Valid units: {", ".join(VALID_UNITS)}')
+        self.unidade_medida = self.unidade_medida.upper()
 
 
-class ProdutoUpdateDTO(UpdateDTO):
+class ProdutoUpdateDTO(msgspec.Struct, kw_only=True):
     """DTO for updating products."""
-    nome: Optional[str] = Field(None, min_length=1, max_length=255)
-    descricao: Optional[str] = Field(None, max_length=1000)
-    categoria: Optional[str] = Field(None, min_length=1, max_length=100)
-    nivel_minimo: Optional[int] = Field(None, ge=0)
+    nome: Optional[Annotated[str, Meta(min_length=1, max_length=255)]] = None
+    descricao: Optional[Annotated[str, Meta(max_length=1000)]] = None
+    categoria: Optional[Annotated[str, Meta(min_length=1, max_length=100)]] = None
+    nivel_minimo: Optional[Annotated[int, Meta(ge=0)]] = None
     ativo: Optional[bool] = None
 
 
-class ProdutoResponseDTO(ResponseDTO):
-    """DTO for product responses."""
+class ProdutoResponseDTO(NamedTuple):
+    """DTO for product responses (outbound only, built from trusted entities)."""
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
     sku: str
     nome: str
     descricao: str
@@ -54,7 +55,7 @@ class ProdutoResponseDTO(ResponseDTO):
     ativo: bool
 
 
-class ProdutoListResponseDTO(BaseDTO):
+class ProdutoListResponseDTO(NamedTuple):
     """DTO for product list responses."""
     produtos: List[ProdutoResponseDTO]
     total: int
@@ -62,9 +63,9 @@ class ProdutoListResponseDTO(BaseDTO):
     page_size: int
 
 
-class ProdutoSearchDTO(BaseDTO):
+class ProdutoSearchDTO(msgspec.Struct, kw_only=True):
     """DTO for product search."""
-    nome: Optional[str] = Field(None, min_length=1)
-    categoria: Optional[str] = Field(None, min_length=1)
+    nome: Optional[Annotated[str, Meta(min_length=1)]] = None
+    categoria: Optional[Annotated[str, Meta(min_length=1)]] = None
     ativo: Optional[bool] = None
-    sku: Optional[str] = Field(None, min_length=1)
\ No newline at end of file
+    sku: Optional[Annotated[str, Meta(min_length=1)]] = None
@@ -1,7 +1,7 @@
 # src/inventory/application/services/produto_application_service.py
 """Product application service."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
 import structlog
@@ -109,6 +109,16 @@ class ProdutoApplicationService(BaseApplicationService[Produto]):
             logger.error("Error getting products", skip=skip, limit=limit, error=str(e))
             raise
     
+    async def stream_products(self, skip: int = 0, limit: int = 100) -> AsyncIterator[ProdutoResponseDTO]:
+        """Stream products with pagination, without building a list response."""
+        try:
+            async for product in self.produto_repository.stream_all(skip, limit):
+                yield self._entity_to_response_dto(product)
+            
+        except Exception as e:
+            logger.error("Error streaming products", skip=skip, limit=limit, error=str(e))
+            raise
+    
     async def search_products(self, search_dto: ProdutoSearchDTO, skip: int = 0, limit: int = 100) -> ProdutoListResponseDTO:
         """Search products."""
         try:
@@ -220,7 +230,8 @@ class ProdutoApplicationService(BaseApplicationService[Produto]):
             logger.error("Error getting products by category", categoria=categoria, error=str(e))
             raise
     
-    def _entity_to_response_dto(self, product: Produto) -> ProdutoResponseDTO:
+    @staticmethod
+    def _entity_to_response_dto(product: Produto) -> ProdutoResponseDTO:
         """Convert entity to response DTO."""
         return ProdutoResponseDTO(
             id=product.id,
@@ -2,7 +2,7 @@
 """Product repository interface."""
 
 from abc import abstractmethod
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from uuid import UUID
 
 from src.shared.infrastructure.repositories.base import BaseRepository
@@ -18,6 +18,11 @@ class ProdutoRepository(BaseRepository[Produto]):
         """Get product by SKU."""
         pass
     
+    @abstractmethod
+    def stream_all(self, skip: int = 0, limit: int = 100) -> AsyncIterator[Produto]:
+        """Stream products with pagination, one row at a time."""
+        pass
+    
     @abstractmethod
     async def get_by_category(self, categoria: str, skip: int = 0, limit: int = 100) -> List[Produto]:
         """Get products by category."""
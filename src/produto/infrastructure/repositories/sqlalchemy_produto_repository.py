@@ -1,7 +1,7 @@
 # src/inventory/infrastructure/repositories/sqlalchemy_produto_repository.py
 """SQLAlchemy implementation of ProdutoRepository."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
 import structlog
@@ -75,6 +75,24 @@ class SqlAlchemyProdutoRepository(ProdutoRepository):
             logger.error("Error getting all products", skip=skip, limit=limit, error=str(e))
             raise
     
+    async def stream_all(self, skip: int = 0, limit: int = 100) -> AsyncIterator[Produto]:
+        """Stream products with pagination, one row at a time."""
+        try:
+            query = (
+                select(ProdutoModel)
+                .offset(skip)
+                .limit(limit)
+                .order_by(ProdutoModel.created_at.desc())
+            )
+            result = await self.db.stream_scalars(query)
+            
+            async for model in result:
+                yield self._model_to_entity(model)
+            
+        except Exception as e:
+            logger.error("Error streaming products", skip=skip, limit=limit, error=str(e))
+            raise
+    
     async def get_by_category(self, categoria: str, skip: int = 0, limit: int = 100) -> List[Produto]:
         """Get products by category."""
         try:
@@ -7,7 +7,6 @@ import structlog
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
-from sqlalchemy.pool import NullPool
 
 logger = structlog.get_logger()
 
@@ -32,17 +31,25 @@ class Base(DeclarativeBase):
     )
 
 
-async def init_db(database_url: str) -> None:
+async def init_db(
+    database_url: str,
+    pool_size: int = 1,
+    max_overflow: int = 4,
+    pool_recycle: int = 300,
+) -> None:
     """Initialize database connections."""
     global async_engine, async_session_factory, sync_engine, sync_session_factory
     
     # Convert PostgreSQL URL for async
     async_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
     
-    # Async engine for FastAPI
+    # Async engine, pool sized for one Lambda container and reused while warm
     async_engine = create_async_engine(
         async_url,
-        poolclass=NullPool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=pool_recycle,
     )
     
     async_session_factory = async_sessionmaker(
@@ -2,38 +2,73 @@
 """Decorators para substituir FastAPI Depends em Lambda functions."""
 
 import asyncio
-import json
+import base64
+import binascii
 import functools
-from typing import Dict, Any, Callable, List, Optional
+import sys
+from typing import Dict, Any, Callable, FrozenSet, Iterable, Optional, Union
 from dataclasses import dataclass
 
 from src.config import get_settings
+import msgspec
+import orjson
 import structlog
-from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    import uvloop
+except ImportError:  # uvloop não está disponível (ex.: Windows)
+    uvloop = None
+
+from src.shared.domain.exceptions.base import (
+    BusinessRuleException,
+    NotFoundException,
+    ValidationException,
+)
 from src.shared.infrastructure.database.connection import get_async_session, init_db
 
 logger = structlog.get_logger()
 
+ADMIN_PERMISSION = sys.intern("admin:*")
+
+# exceções de domínio -> status HTTP
+_EXC_MAP = {
+    ValidationException: 400,
+    NotFoundException: 404,
+    BusinessRuleException: 409,
+}
+
+
+# Pooled asyncpg connections are bound to the loop that opened them, so every
+# invocation runs on this container-wide loop instead of a fresh asyncio.run().
+_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+asyncio.set_event_loop(_loop)
+_loop.run_until_complete(init_db(get_settings().database_url))
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization",
+}
 
-asyncio.get_event_loop().run_until_complete(init_db(get_settings().database_url))
 
 @dataclass
 class LambdaResponse:
     status_code: int
-    body: Dict[str, Any]
+    body: Union[Dict[str, Any], bytes]
     headers: Optional[Dict[str, str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        # bytes já vêm serializados (ex.: NDJSON)
+        if isinstance(self.body, bytes):
+            body = self.body
+        else:
+            body = orjson.dumps(self.body, default=str, option=orjson.OPT_UTC_Z)
         response = {
             "statusCode": self.status_code,
-            "body": json.dumps(self.body, default=str),
-            "headers": self.headers or {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-                "Access-Control-Allow-Headers": "Content-Type,Authorization",
-            },
+            "body": body.decode(),
+            "headers": self.headers or {"Content-Type": "application/json", **CORS_HEADERS},
         }
         return response
 
@@ -45,14 +80,34 @@ class LambdaException(Exception):
         super().__init__(detail)
 
 
-def lambda_handler(func: Callable) -> Callable:
+def _raw_body(event: Dict[str, Any]) -> Union[str, bytes, None]:
+    """Body bruto do evento, decodificando base64 quando o API Gateway enviar assim."""
+    raw = event.get("body")
+    if raw and event.get("isBase64Encoded"):
+        try:
+            return base64.b64decode(raw, validate=True)
+        except binascii.Error:
+            raise LambdaException(400, "Invalid base64 request body")
+    return raw
+
+
+def lambda_handler(func: Callable, parse_body: bool = True) -> Callable:
+    """
+    Adapta um handler async ao runtime do Lambda.
+    Com parse_body=False o handler recebe o body bruto (já sem base64), sem parse JSON.
+    """
     @functools.wraps(func)
     def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-        import asyncio
-
         async def async_wrapper():
             try:
-                body = json.loads(event["body"]) if event.get("body") else {}
+                raw_body = _raw_body(event)
+                if parse_body:
+                    try:
+                        body = orjson.loads(raw_body) if raw_body else {}
+                    except orjson.JSONDecodeError:
+                        raise LambdaException(400, "Invalid JSON request body")
+                else:
+                    body = raw_body
                 path_params = event.get("pathParameters") or {}
                 query_params = event.get("queryStringParameters") or {}
 
@@ -64,11 +119,11 @@ def lambda_handler(func: Callable) -> Callable:
 
             except LambdaException as e:
                 return LambdaResponse(e.status_code, {"detail": e.detail}).to_dict()
-            except Exception as e:
-                logger.error("Lambda handler error", error=str(e))
+            except Exception:
+                logger.exception("Lambda handler error")
                 return LambdaResponse(500, {"detail": "Internal server error"}).to_dict()
 
-        return asyncio.run(async_wrapper())
+        return _loop.run_until_complete(async_wrapper())
 
     return wrapper
 
@@ -91,68 +146,101 @@ def with_database(func: Callable) -> Callable:
     return wrapper
 
 
+def _freeze_permissions(permissions: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Congela (e interna) as permissões exigidas na aplicação do decorator."""
+    return frozenset(sys.intern(p) for p in permissions or ())
+
+
+def _authenticate(event: Dict[str, Any], permissions: FrozenSet[str]) -> Dict[str, Any]:
+    """Extrai o user_info do requestContext.authorizer e checa as permissões."""
+    auth_ctx = (event.get("requestContext") or {}).get("authorizer") or {}
+    user_id = auth_ctx.get("userId")
+    if not user_id:
+        raise LambdaException(401, "Unauthorized")
+
+    # monta o user_info
+    perms_raw = auth_ctx.get("permissoes", "")
+    perms = perms_raw.split(",") if perms_raw else []
+    user_info = {
+        "userId": user_id,
+        "email": auth_ctx.get("email"),
+        "permissoes": perms,
+    }
+    # loga o usuário autenticado
+    logger.info(f"USer info {user_info}, perms: {perms}")
 
-def require_auth(permissions: Optional[List[str]] = None):
+    # checa permissões, se fornecidas (basta uma delas, ou admin:*)
+    if permissions:
+        if ADMIN_PERMISSION not in perms and permissions.isdisjoint(perms):
+            raise LambdaException(403, f"Permission required: {sorted(permissions)}")
+
+    return user_info
+
+
+def map_domain_exceptions(func: Callable, handler_logger) -> Callable:
     """
-    Substitui @with_auth + @require_permission(...).
-    Se permissions for None ou vazio, só exige que o usuário esteja autenticado.
-    Caso contrário, também checa cada permissão na lista.
+    Converte exceções de domínio em LambdaException com o status de _EXC_MAP.
+    Qualquer outra exceção é logada com handler_logger e vira 500.
     """
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(event: Dict[str, Any], context: Any, *args, **kwargs):
-            # 1) extrai user_info do requestContext.authorizer
-            auth_ctx = (event.get("requestContext") or {}).get("authorizer") or {}
-            user_id = auth_ctx.get("userId")
-            if not user_id:
-                raise LambdaException(401, "Unauthorized")
-
-            # monta o user_info
-            perms_raw = auth_ctx.get("permissoes", "")
-            perms = perms_raw.split(",") if perms_raw else []
-            user_info = {
-                "userId": user_id,
-                "email": auth_ctx.get("email"),
-                "permissoes": perms,
-            }
-            kwargs["user_info"] = user_info
-            # loga o usuário autenticado
-            logger.info(f"USer info {user_info}, perms: {perms}")
-            # 2) checa permissões, se fornecidas
-            if permissions:
-                allowed = False
-                for req in permissions:
-                    if req in perms or "admin:*" in perms:
-                        allowed = True
-                        break
-                if not allowed:
-                    raise LambdaException(403, f"Permission required: {permissions}")
-
-            # 3) chama a função original
-            try:
-                return await func(event, context, *args, **kwargs)
-            except LambdaException:
-                raise
-            except Exception as e:
-                logger.error("Auth wrapper error", error=str(e))
-                raise LambdaException(500, "Authentication error")
 
-        return wrapper
-    return decorator
+    @functools.wraps(func)
+    async def wrapper(event, context, body, path_params, query_params, **kwargs):
+        try:
+            return await func(event, context, body, path_params, query_params, **kwargs)
+        except LambdaException:
+            raise
+        except Exception as e:
+            status_code = _EXC_MAP.get(type(e))
+            if status_code is not None:
+                raise LambdaException(status_code, e.message)
+            handler_logger.exception("Handler error", path_params=path_params)
+            raise LambdaException(500, "Internal server error")
 
+    return wrapper
+
+
+def build_handler(
+    permissions: Optional[Iterable[str]] = None,
+    dto_class=None,
+    *,
+    service_logger,
+):
+    """
+    Compõe @lambda_handler + autenticação (permissions) + validação do body
+    (dto_class) + @with_database + @map_domain_exceptions.
+    Autenticação e validação do body acontecem antes de abrir a sessão.
+    Erros inesperados são logados com service_logger ligado ao nome do handler.
+    dto_class precisa ser um msgspec.Struct: o body é decodificado e validado
+    direto do body bruto, sem o parse JSON do lambda_handler. Nesse caso o
+    handler recebe body=None e lê os campos de `dto`; sem dto_class, `body`
+    é o dict parseado.
+    """
+    if dto_class is not None and not (
+        isinstance(dto_class, type) and issubclass(dto_class, msgspec.Struct)
+    ):
+        raise TypeError(f"dto_class must be a msgspec.Struct, got {dto_class!r}")
+
+    required = _freeze_permissions(permissions)
+    decoder = msgspec.json.Decoder(dto_class, strict=False) if dto_class is not None else None
 
-def validate_request_body(dto_class):
     def decorator(func: Callable) -> Callable:
+        handler_logger = service_logger.bind(handler=func.__name__)
+        handler = with_database(map_domain_exceptions(func, handler_logger))
+
         @functools.wraps(func)
-        async def wrapper(event, context, body, *args, **kwargs):
-            try:
-                dto = dto_class(**body)
-                kwargs["dto"] = dto
-                return await func(event, context, body, *args, **kwargs)
-            except Exception as e:
-                raise LambdaException(400, f"Invalid request body: {e}")
+        async def wrapper(event, context, body, path_params, query_params):
+            kwargs = {"user_info": _authenticate(event, required)}
+
+            if decoder is not None:
+                try:
+                    kwargs["dto"] = decoder.decode(body or b"{}")
+                except msgspec.MsgspecError as e:
+                    raise LambdaException(400, f"Invalid request body: {e}")
+                body = None
+
+            return await handler(event, context, body, path_params, query_params, **kwargs)
 
-        return wrapper
+        return lambda_handler(wrapper, parse_body=decoder is None)
 
     return decorator
 
@@ -169,5 +257,15 @@ def created_response(data: Any) -> LambdaResponse:
     return LambdaResponse(201, data)
 
 
+def ndjson_response(body: bytes) -> LambdaResponse:
+    return LambdaResponse(200, body, {"Content-Type": NDJSON_CONTENT_TYPE, **CORS_HEADERS})
+
+
+def wants_ndjson(event: Dict[str, Any]) -> bool:
+    headers = event.get("headers") or {}
+    accept = headers.get("accept") or headers.get("Accept")
+    return accept == NDJSON_CONTENT_TYPE
+
+
 def no_content_response() -> LambdaResponse:
     return LambdaResponse(204, {})
@@ -0,0 +1,59 @@
+import pytest
+
+from src.utils import lambda_decorators
+
+
+class FakeSession:
+    """Stands in for AsyncSession; records what with_database did with it."""
+
+    def __init__(self):
+        self.committed = False
+        self.rolled_back = False
+        self.closed = False
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        self.rolled_back = True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def db_session(monkeypatch):
+    """Replace the database session factory used by with_database."""
+    session = FakeSession()
+
+    async def fake_get_async_session():
+        yield session
+
+    monkeypatch.setattr(lambda_decorators, "get_async_session", fake_get_async_session)
+    return session
+
+
+@pytest.fixture()
+def make_event():
+    """Build a minimal API Gateway proxy event."""
+
+    def _make_event(
+        body=None,
+        path_params=None,
+        query_params=None,
+        headers=None,
+        user_id="user-1",
+        permissoes="",
+        is_base64=False,
+    ):
+        authorizer = {"userId": user_id, "email": "user@example.com", "permissoes": permissoes}
+        return {
+            "body": body,
+            "isBase64Encoded": is_base64,
+            "pathParameters": path_params,
+            "queryStringParameters": query_params,
+            "headers": headers,
+            "requestContext": {"authorizer": authorizer if user_id else {}},
+        }
+
+    return _make_event
@@ -0,0 +1,270 @@
+import asyncio
+import base64
+import json
+
+import msgspec
+import pytest
+import structlog
+from pydantic import BaseModel
+
+from src.shared.domain.exceptions.base import (
+    BusinessRuleException,
+    NotFoundException,
+    ValidationException,
+)
+from src.utils.lambda_decorators import (
+    LambdaException,
+    build_handler,
+    error_response,
+    map_domain_exceptions,
+    ndjson_response,
+    success_response,
+    wants_ndjson,
+)
+
+
+service_logger = structlog.get_logger()
+
+
+class ItemDTO(msgspec.Struct, kw_only=True):
+    nome: str
+    quantidade: int = 0
+
+
+def _body(response):
+    return json.loads(response["body"])
+
+
+# === map_domain_exceptions ===
+
+@pytest.mark.parametrize(
+    "exc, status_code",
+    [
+        (ValidationException("invalid"), 400),
+        (NotFoundException("missing"), 404),
+        (BusinessRuleException("conflict"), 409),
+    ],
+)
+def test_map_domain_exceptions_maps_domain_errors(exc, status_code):
+    async def handler(event, context, body, path_params, query_params):
+        raise exc
+
+    wrapped = map_domain_exceptions(handler, service_logger)
+
+    with pytest.raises(LambdaException) as info:
+        asyncio.run(wrapped({}, None, {}, {}, {}))
+
+    assert info.value.status_code == status_code
+    assert info.value.detail == exc.message
+
+
+def test_map_domain_exceptions_turns_unexpected_errors_into_500():
+    async def handler(event, context, body, path_params, query_params):
+        raise RuntimeError("boom")
+
+    wrapped = map_domain_exceptions(handler, service_logger)
+
+    with pytest.raises(LambdaException) as info:
+        asyncio.run(wrapped({}, None, {}, {}, {}))
+
+    assert info.value.status_code == 500
+    assert info.value.detail == "Internal server error"
+
+
+def test_map_domain_exceptions_passes_lambda_exceptions_through():
+    async def handler(event, context, body, path_params, query_params):
+        raise LambdaException(418, "teapot")
+
+    wrapped = map_domain_exceptions(handler, service_logger)
+
+    with pytest.raises(LambdaException) as info:
+        asyncio.run(wrapped({}, None, {}, {}, {}))
+
+    assert info.value.status_code == 418
+
+
+# === build_handler ===
+
+@pytest.mark.parametrize(
+    "exc, status_code",
+    [
+        (ValidationException("invalid"), 400),
+        (NotFoundException("missing"), 404),
+        (BusinessRuleException("SKU already exists: A1"), 409),
+        (RuntimeError("boom"), 500),
+    ],
+)
+def test_build_handler_maps_exceptions_and_rolls_back(db_session, make_event, exc, status_code):
+    @build_handler(service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info):
+        raise exc
+
+    response = handler(make_event(), None)
+
+    assert response["statusCode"] == status_code
+    assert db_session.rolled_back
+    assert not db_session.committed
+    if status_code == 500:
+        assert _body(response) == {"detail": "Internal server error"}
+    else:
+        assert _body(response) == {"detail": exc.message}
+
+
+def test_build_handler_requires_authenticated_user(db_session, make_event):
+    @build_handler(service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info):
+        return success_response({"ok": True})
+
+    response = handler(make_event(user_id=None), None)
+
+    assert response["statusCode"] == 401
+    assert _body(response) == {"detail": "Unauthorized"}
+    assert not db_session.committed
+
+
+def test_build_handler_passes_session_and_commits(db_session, make_event):
+    @build_handler(service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info):
+        assert db is db_session
+        assert user_info["userId"] == "user-1"
+        return success_response({"ok": True})
+
+    response = handler(make_event(), None)
+
+    assert response["statusCode"] == 200
+    assert db_session.committed
+    assert db_session.closed
+    assert not db_session.rolled_back
+
+
+def test_build_handler_decodes_dto_body(db_session, make_event):
+    @build_handler(dto_class=ItemDTO, service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info, dto):
+        assert body is None
+        return success_response({"nome": dto.nome, "quantidade": dto.quantidade})
+
+    response = handler(make_event(body='{"nome": "Caneta", "quantidade": "3"}'), None)
+
+    assert response["statusCode"] == 200
+    assert _body(response) == {"nome": "Caneta", "quantidade": 3}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        None,
+        '{"quantidade": 1}',
+        '{"nome": "Caneta", "quantidade": "x"}',
+        '{"nome": ',
+    ],
+)
+def test_build_handler_rejects_invalid_dto_body(db_session, make_event, body):
+    @build_handler(dto_class=ItemDTO, service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info, dto):
+        return success_response({"ok": True})
+
+    response = handler(make_event(body=body), None)
+
+    assert response["statusCode"] == 400
+    assert _body(response)["detail"].startswith("Invalid request body:")
+    assert not db_session.committed
+
+
+def test_build_handler_rejects_non_struct_dto_class():
+    class PydanticDTO(BaseModel):
+        nome: str
+
+    with pytest.raises(TypeError):
+        build_handler(dto_class=PydanticDTO, service_logger=service_logger)
+
+
+@pytest.mark.parametrize(
+    "permissoes, status_code",
+    [
+        ("produto:read", 403),
+        ("", 403),
+        ("produto:read,produto:create", 200),
+        ("admin:*", 200),
+    ],
+)
+def test_build_handler_checks_permissions(db_session, make_event, permissoes, status_code):
+    @build_handler(permissions=["produto:create"], service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info):
+        return success_response({"user": user_info["userId"]})
+
+    response = handler(make_event(permissoes=permissoes), None)
+
+    assert response["statusCode"] == status_code
+    if status_code == 403:
+        assert _body(response) == {"detail": "Permission required: ['produto:create']"}
+
+
+def test_build_handler_decodes_base64_body(db_session, make_event):
+    @build_handler(dto_class=ItemDTO, service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info, dto):
+        return success_response({"nome": dto.nome})
+
+    encoded = base64.b64encode(b'{"nome": "Caneta"}').decode()
+    response = handler(make_event(body=encoded, is_base64=True), None)
+
+    assert response["statusCode"] == 200
+    assert _body(response) == {"nome": "Caneta"}
+
+
+def test_build_handler_rejects_invalid_base64_body(db_session, make_event):
+    @build_handler(dto_class=ItemDTO, service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info, dto):
+        return success_response({"ok": True})
+
+    response = handler(make_event(body="not-base64!", is_base64=True), None)
+
+    assert response["statusCode"] == 400
+    assert _body(response) == {"detail": "Invalid base64 request body"}
+
+
+def test_build_handler_rejects_malformed_json_without_dto(db_session, make_event):
+    @build_handler(service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info):
+        return success_response({"ok": True})
+
+    response = handler(make_event(body='{"nome": '), None)
+
+    assert response["statusCode"] == 400
+    assert _body(response) == {"detail": "Invalid JSON request body"}
+
+
+def test_build_handler_returns_handler_error_response(db_session, make_event):
+    @build_handler(service_logger=service_logger)
+    async def handler(event, context, body, path_params, query_params, db, user_info):
+        return error_response("Product not found: 1", 404)
+
+    response = handler(make_event(), None)
+
+    assert response["statusCode"] == 404
+    assert _body(response) == {"detail": "Product not found: 1"}
+    assert db_session.committed
+
+
+# === NDJSON ===
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"Accept": "application/x-ndjson"}, True),
+        ({"accept": "application/x-ndjson"}, True),
+        ({"Accept": "application/json"}, False),
+        ({}, False),
+        (None, False),
+    ],
+)
+def test_wants_ndjson(headers, expected):
+    assert wants_ndjson({"headers": headers}) is expected
+
+
+def test_ndjson_response_keeps_body_and_sets_content_type():
+    response = ndjson_response(b'{"a":1}\n{"a":2}\n').to_dict()
+
+    assert response["statusCode"] == 200
+    assert response["body"] == '{"a":1}\n{"a":2}\n'
+    assert response["headers"]["Content-Type"] == "application/x-ndjson"
+    assert response["headers"]["Access-Control-Allow-Origin"] == "*"
@@ -0,0 +1,95 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from src.handlers import produto_handler
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    produto_handler._PRODUCT_CACHE.clear()
+    yield
+    produto_handler._PRODUCT_CACHE.clear()
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic."""
+    now = [1000.0]
+    monkeypatch.setattr(produto_handler.time, "monotonic", lambda: now[0])
+    return now
+
+
+class FakeService:
+    def __init__(self, product):
+        self.product = product
+        self.calls = 0
+
+    async def get_product_by_id(self, product_id):
+        self.calls += 1
+        return self.product
+
+
+def test_cache_hit_returns_stored_payload(clock):
+    product_id = uuid4()
+    produto_handler._cache_put(product_id, {"nome": "Caneta"})
+
+    assert produto_handler._cache_get(product_id) == {"nome": "Caneta"}
+
+
+def test_cache_entry_expires_after_ttl(clock, monkeypatch):
+    monkeypatch.setattr(produto_handler, "_PRODUCT_CACHE_TTL", 5.0)
+    product_id = uuid4()
+    produto_handler._cache_put(product_id, {"nome": "Caneta"})
+
+    clock[0] += 5.0
+    assert produto_handler._cache_get(product_id) == {"nome": "Caneta"}
+
+    clock[0] += 0.1
+    assert produto_handler._cache_get(product_id) is None
+    assert product_id not in produto_handler._PRODUCT_CACHE
+
+
+def test_cache_evicts_oldest_entry_when_full(clock, monkeypatch):
+    monkeypatch.setattr(produto_handler, "_PRODUCT_CACHE_MAXSIZE", 2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    produto_handler._cache_put(first, {"n": 1})
+    produto_handler._cache_put(second, {"n": 2})
+    produto_handler._cache_put(third, {"n": 3})
+
+    assert produto_handler._cache_get(first) is None
+    assert produto_handler._cache_get(second) == {"n": 2}
+    assert produto_handler._cache_get(third) == {"n": 3}
+
+
+def test_get_product_handler_serves_cached_payload(clock, monkeypatch, db_session, make_event):
+    product_id = uuid4()
+    monkeypatch.setattr(produto_handler, "_PRODUCT_CACHE_ENABLED", True)
+    produto_handler._cache_put(product_id, {"nome": "Cached"})
+    service = FakeService(product=None)
+    monkeypatch.setattr(produto_handler, "ProdutoApplicationService", lambda db: service)
+
+    response = produto_handler.get_product_handler(
+        make_event(path_params={"product_id": str(product_id)}), None
+    )
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"nome": "Cached"}
+    assert service.calls == 0
+
+
+def test_get_product_handler_ignores_cache_when_disabled(clock, monkeypatch, db_session, make_event):
+    product_id = uuid4()
+    monkeypatch.setattr(produto_handler, "_PRODUCT_CACHE_ENABLED", False)
+    produto_handler._cache_put(product_id, {"nome": "Cached"})
+    service = FakeService(product=None)
+    monkeypatch.setattr(produto_handler, "ProdutoApplicationService", lambda db: service)
+
+    response = produto_handler.get_product_handler(
+        make_event(path_params={"product_id": str(product_id)}), None
+    )
+
+    assert response["statusCode"] == 404
+    assert service.calls == 1
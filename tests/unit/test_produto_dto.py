@@ -0,0 +1,75 @@
+import msgspec
+import pytest
+
+from src.produto.application.dto.produto_dto import (
+    ProdutoCreateDTO,
+    ProdutoSearchDTO,
+    ProdutoUpdateDTO,
+)
+
+
+def _decode(data: bytes, dto_class):
+    return msgspec.json.decode(data, type=dto_class, strict=False)
+
+
+def test_create_dto_normalizes_sku_and_unit():
+    dto = _decode(
+        b'{"sku": "cx-01_a", "nome": "Caixa", "categoria": "Embalagens", "unidade_medida": "cx"}',
+        ProdutoCreateDTO,
+    )
+
+    assert dto.sku == "CX-01_A"
+    assert dto.unidade_medida == "CX"
+    assert dto.descricao == ""
+    assert dto.nivel_minimo == 0
+    assert dto.ativo is True
+
+
+def test_create_dto_coerces_numeric_strings():
+    dto = _decode(
+        b'{"sku": "A1", "nome": "N", "categoria": "C", "unidade_medida": "UN", "nivel_minimo": "5"}',
+        ProdutoCreateDTO,
+    )
+
+    assert dto.nivel_minimo == 5
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b'{"nome": "N", "categoria": "C", "unidade_medida": "UN"}', "missing required field `sku`"),
+        (b'{"sku": "A 1", "nome": "N", "categoria": "C", "unidade_medida": "UN"}', "SKU must contain"),
+        (b'{"sku": "A1", "nome": "N", "categoria": "C", "unidade_medida": "XX"}', "Invalid unit"),
+        (b'{"sku": "", "nome": "N", "categoria": "C", "unidade_medida": "UN"}', "length >= 1"),
+        (b'{"sku": "A1", "nome": "N", "categoria": "C", "unidade_medida": "UN", "nivel_minimo": -1}', ">= 0"),
+    ],
+)
+def test_create_dto_rejects_invalid_input(data, message):
+    with pytest.raises(msgspec.ValidationError, match=message):
+        _decode(data, ProdutoCreateDTO)
+
+
+def test_create_dto_rejects_too_long_sku():
+    data = b'{"sku": "' + b"A" * 51 + b'", "nome": "N", "categoria": "C", "unidade_medida": "UN"}'
+
+    with pytest.raises(msgspec.ValidationError, match="length <= 50"):
+        _decode(data, ProdutoCreateDTO)
+
+
+def test_update_dto_fields_are_optional():
+    dto = _decode(b"{}", ProdutoUpdateDTO)
+
+    assert dto == ProdutoUpdateDTO()
+
+
+@pytest.mark.parametrize("data", [b'{"nome": ""}', b'{"nivel_minimo": -1}'])
+def test_update_dto_rejects_invalid_values(data):
+    with pytest.raises(msgspec.ValidationError):
+        _decode(data, ProdutoUpdateDTO)
+
+
+def test_search_dto_rejects_empty_filters():
+    with pytest.raises(msgspec.ValidationError):
+        _decode(b'{"nome": ""}', ProdutoSearchDTO)
+
+    assert _decode(b'{"ativo": true}', ProdutoSearchDTO).ativo is True
@@ -0,0 +1,177 @@
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from src.handlers import produto_handler
+from src.produto.application.dto.produto_dto import ProdutoListResponseDTO, ProdutoResponseDTO
+from src.utils.lambda_decorators import LambdaException
+
+
+PRODUCT_ID = "8c4d1a6e-2f55-4c8e-9c2a-3b1f6f0d9a10"
+TIMESTAMP = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _product(sku: str = "CX-01") -> ProdutoResponseDTO:
+    return ProdutoResponseDTO(
+        id=UUID(PRODUCT_ID),
+        created_at=TIMESTAMP,
+        updated_at=TIMESTAMP,
+        sku=sku,
+        nome="Caixa",
+        descricao="",
+        categoria="Embalagens",
+        unidade_medida="CX",
+        nivel_minimo=0,
+        ativo=True,
+    )
+
+
+def _product_json(sku: str = "CX-01") -> dict:
+    return {
+        "id": PRODUCT_ID,
+        "created_at": "2025-01-02T03:04:05Z",
+        "updated_at": "2025-01-02T03:04:05Z",
+        "sku": sku,
+        "nome": "Caixa",
+        "descricao": "",
+        "categoria": "Embalagens",
+        "unidade_medida": "CX",
+        "nivel_minimo": 0,
+        "ativo": True,
+    }
+
+
+class FakeService:
+    """Stands in for ProdutoApplicationService in handler tests."""
+
+    def __init__(self, products=()):
+        self.products = list(products)
+
+    async def get_product_by_id(self, product_id):
+        return next((p for p in self.products if p.id == product_id), None)
+
+    async def get_products(self, skip, limit):
+        page = self.products[skip:skip + limit]
+        return ProdutoListResponseDTO(
+            produtos=page, total=len(self.products), page=skip // limit + 1, page_size=limit
+        )
+
+    async def stream_products(self, skip, limit):
+        for product in self.products[skip:skip + limit]:
+            yield product
+
+
+@pytest.fixture()
+def service(monkeypatch):
+    fake = FakeService()
+    monkeypatch.setattr(produto_handler, "ProdutoApplicationService", lambda db: fake)
+    return fake
+
+
+# === Request validation ===
+
+def test_require_uuid_parses_path_parameter():
+    assert produto_handler._require_uuid({"product_id": PRODUCT_ID}, "product_id") == UUID(PRODUCT_ID)
+
+
+@pytest.mark.parametrize(
+    "path_params, detail",
+    [
+        ({}, "product_id is required"),
+        ({"product_id": ""}, "product_id is required"),
+        ({"product_id": "not-a-uuid"}, "Invalid product_id format"),
+    ],
+)
+def test_require_uuid_rejects_missing_or_invalid_id(path_params, detail):
+    with pytest.raises(LambdaException) as info:
+        produto_handler._require_uuid(path_params, "product_id")
+
+    assert info.value.status_code == 400
+    assert info.value.detail == detail
+
+
+@pytest.mark.parametrize(
+    "query_params, expected",
+    [
+        ({}, (0, 100)),
+        ({"skip": "20", "limit": "10"}, (20, 10)),
+        ({"limit": "1"}, (0, 1)),
+        ({"limit": "1000"}, (0, 1000)),
+    ],
+)
+def test_parse_pagination(query_params, expected):
+    assert produto_handler._parse_pagination(query_params) == expected
+
+
+@pytest.mark.parametrize(
+    "query_params, detail",
+    [
+        ({"skip": "a"}, "skip and limit must be integers"),
+        ({"limit": "1.5"}, "skip and limit must be integers"),
+        ({"skip": "-1"}, "skip must be >= 0"),
+        ({"limit": "0"}, "limit must be between 1 and 1000"),
+        ({"limit": "1001"}, "limit must be between 1 and 1000"),
+    ],
+)
+def test_parse_pagination_rejects_invalid_values(query_params, detail):
+    with pytest.raises(LambdaException) as info:
+        produto_handler._parse_pagination(query_params)
+
+    assert info.value.status_code == 400
+    assert info.value.detail == detail
+
+
+# === Response serialization ===
+
+def test_get_product_handler_returns_json_object(service, db_session, make_event):
+    service.products = [_product()]
+
+    response = produto_handler.get_product_handler(
+        make_event(path_params={"product_id": PRODUCT_ID}), None
+    )
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == _product_json()
+
+
+def test_list_products_handler_returns_nested_json_objects(service, db_session, make_event):
+    service.products = [_product("CX-01"), _product("CX-02")]
+
+    response = produto_handler.list_products_handler(make_event(), None)
+
+    assert response["statusCode"] == 200
+    assert response["headers"]["Content-Type"] == "application/json"
+    assert json.loads(response["body"]) == {
+        "produtos": [_product_json("CX-01"), _product_json("CX-02")],
+        "total": 2,
+        "page": 1,
+        "page_size": 100,
+    }
+
+
+# === NDJSON listing ===
+
+def test_list_products_handler_streams_ndjson(service, db_session, make_event):
+    service.products = [_product("CX-01"), _product("CX-02")]
+    event = make_event(headers={"Accept": "application/x-ndjson"})
+
+    response = produto_handler.list_products_handler(event, None)
+
+    assert response["statusCode"] == 200
+    assert response["headers"]["Content-Type"] == "application/x-ndjson"
+    assert response["body"].endswith("\n")
+    lines = response["body"].splitlines()
+    assert [json.loads(line) for line in lines] == [_product_json("CX-01"), _product_json("CX-02")]
+
+
+# === Not found ===
+
+def test_get_product_handler_returns_404_for_unknown_product(service, db_session, make_event):
+    response = produto_handler.get_product_handler(
+        make_event(path_params={"product_id": PRODUCT_ID}), None
+    )
+
+    assert response["statusCode"] == 404
+    assert json.loads(response["body"]) == {"detail": f"Product not found: {PRODUCT_ID}"}